@@ -8,6 +8,19 @@ LEGACY_AZURE_RELATION_NAME = "azure-credentials"
 
 AZURE_RELATION_NAME = "azure-storage-credentials"
 
-AZURE_MANDATORY_OPTIONS = ["container", "storage-account", "credentials", "connection-protocol"]
+AZURE_MANDATORY_OPTIONS = ("container", "storage-account", "credentials", "connection-protocol")
+
+AZURE_CONNECTION_OPTIONS = AZURE_MANDATORY_OPTIONS + ("path",)
+
+AZURE_CONNECTION_PROTOCOLS = ("wasb", "wasbs", "abfs", "abfss")
+
+AZURE_RELATION_FIELDS = (
+    "connection-protocol",
+    "container",
+    "storage-account",
+    "secret-key",
+    "endpoint",
+    "path",
+)
 
 KEYS_LIST = ["secret-key"]
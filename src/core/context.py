@@ -5,14 +5,15 @@
 
 """Charm Context definition and parsing logic."""
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ops import ConfigData, Model
 
-from constants import AZURE_MANDATORY_OPTIONS
+from constants import AZURE_CONNECTION_OPTIONS
 from core.domain import AzureConnectionInfo
 from utils.logging import WithLogging
 from utils.secrets import decode_secret_key
+from utils.validation import validate_config
 
 
 class Context(WithLogging):
@@ -21,25 +22,60 @@ class Context(WithLogging):
     def __init__(self, model: Model, config: ConfigData):
         self.model = model
         self.charm_config = config
+        self._azure_storage: Optional[
+            Tuple[tuple, Optional[AzureConnectionInfo], Optional[str]]
+        ] = None
+        self._secret_keys: Dict[str, str] = {}
 
     @property
     def azure_storage(self) -> Optional[AzureConnectionInfo]:
         """Return information related to Azure Storage connection parameters."""
-        for opt in AZURE_MANDATORY_OPTIONS:
-            if self.charm_config.get(opt) is None:
-                return None
+        return self._load_azure_storage()[0]
+
+    @property
+    def azure_storage_error(self) -> Optional[str]:
+        """Return the reason why the Azure Storage connection parameters are not usable."""
+        return self._load_azure_storage()[1]
+
+    def _load_azure_storage(self) -> Tuple[Optional[AzureConnectionInfo], Optional[str]]:
+        """Validate the config, decode the secret and build the connection parameters.
+
+        The result, including the reason why the parameters are not usable, is cached
+        and only recomputed when one of the relevant configuration options changes.
+        """
+        fingerprint = tuple(self.charm_config.get(opt) for opt in AZURE_CONNECTION_OPTIONS)
+        if self._azure_storage is not None and self._azure_storage[0] == fingerprint:
+            return self._azure_storage[1:]
+
+        if errors := validate_config(self.charm_config):
+            self.logger.warning("Invalid configuration: %s", errors)
+            self._azure_storage = (fingerprint, None, "; ".join(errors))
+            return self._azure_storage[1:]
 
-        credentials = self.charm_config.get("credentials")
         try:
-            secret_key = decode_secret_key(self.model, credentials)
+            secret_key = self.get_secret_key(self.charm_config.get("credentials"))
         except Exception as e:
-            self.logger.warning(str(e))
-            secret_key = ""
-
-        return AzureConnectionInfo(
-            connection_protocol=self.charm_config.get("connection-protocol"),
-            container=self.charm_config.get("container"),
-            storage_account=self.charm_config.get("storage-account"),
-            secret_key=secret_key,
-            path=self.charm_config.get("path"),
+            self.logger.warning("Error in decoding secret: %s", e)
+            self._azure_storage = (fingerprint, None, str(e))
+            return self._azure_storage[1:]
+
+        self._azure_storage = (
+            fingerprint,
+            AzureConnectionInfo.from_config(self.charm_config, secret_key),
+            None,
         )
+        return self._azure_storage[1:]
+
+    def clear_cache(self) -> None:
+        """Drop the cached Azure Storage connection parameters and secret keys."""
+        self._azure_storage = None
+        self._secret_keys.clear()
+
+    def get_secret_key(self, secret_id: str) -> Optional[str]:
+        """Return the secret-key stored in the given secret, decoding it at most once.
+
+        Errors are not cached, so a failed lookup is retried on the next call.
+        """
+        if secret_id not in self._secret_keys:
+            self._secret_keys[secret_id] = decode_secret_key(self.model, secret_id)
+        return self._secret_keys[secret_id]
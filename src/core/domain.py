@@ -5,10 +5,18 @@
 
 """Definition of various model classes."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Mapping
 
+ENDPOINT_TEMPLATES = {
+    "wasb": "wasb://{container}@{storage_account}.blob.core.windows.net/",
+    "wasbs": "wasbs://{container}@{storage_account}.blob.core.windows.net/",
+    "abfs": "abfs://{container}@{storage_account}.dfs.core.windows.net/",
+    "abfss": "abfss://{container}@{storage_account}.dfs.core.windows.net/",
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AzureConnectionInfo:
     """Azure connection parameters."""
 
@@ -17,15 +25,31 @@ class AzureConnectionInfo:
     storage_account: str
     secret_key: str
     path: str = None
+    endpoint: str = field(init=False)
+
+    @classmethod
+    def from_config(cls, config: Mapping, secret_key: str) -> "AzureConnectionInfo":
+        """Build the connection parameters from the charm config and the decoded secret key."""
+        return cls(
+            connection_protocol=config.get("connection-protocol"),
+            container=config.get("container"),
+            storage_account=config.get("storage-account"),
+            secret_key=secret_key,
+            path=config.get("path"),
+        )
+
+    def __post_init__(self):
+        """Normalize the connection protocol and compute the endpoint from the other parameters."""
+        if self.connection_protocol:
+            object.__setattr__(self, "connection_protocol", self.connection_protocol.lower())
+        object.__setattr__(self, "endpoint", self._build_endpoint())
 
-    @property
-    def endpoint(self):
+    def _build_endpoint(self) -> str:
         """The endpoint constructed from the other parameters."""
-        if self.connection_protocol.lower() in ("wasb", "wasbs"):
-            return f"{self.connection_protocol}://{self.container}@{self.storage_account}.blob.core.windows.net/"
-        elif self.connection_protocol.lower() in ("abfs", "abfss"):
-            return f"{self.connection_protocol}://{self.container}@{self.storage_account}.dfs.core.windows.net/"
-        return ""
+        template = ENDPOINT_TEMPLATES.get(self.connection_protocol)
+        if template is None:
+            return ""
+        return template.format(container=self.container, storage_account=self.storage_account)
 
     def to_dict(self) -> dict:
         """Return the Azure connection parameters as a dictionary."""
@@ -28,11 +28,12 @@ class ActionEvents(BaseEventHandler, WithLogging):
 
     def on_get_connection_info_action(self, event: ActionEvent):
         """Handle the action `get_connection_info`."""
-        if len(self.context.azure_storage.to_dict()) == 0:
+        azure_storage = self.context.azure_storage
+        if not azure_storage:
             event.fail("Credentials are not set!")
             return
-        results = self.context.azure_storage.to_dict()
-        results = {k: v for k, v in results.items() if v is not None}
+        # to_dict only contains set values, so no further filtering is needed
+        results = azure_storage.to_dict()
         if results.get("secret-key"):
             results["secret-key"] = "**********"
         event.set_results(results)
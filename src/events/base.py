@@ -5,36 +5,36 @@
 """Base utilities exposing common functionalities for all Events classes."""
 
 from functools import wraps
-from typing import Callable
+from typing import Callable, Tuple
 
 from ops import EventBase, Object, StatusBase
 from ops.model import ActiveStatus, BlockedStatus
 
-from constants import AZURE_MANDATORY_OPTIONS
+from core.context import Context
+from managers.azure_storage import AzureStorageManager
 from utils.logging import WithLogging
-from utils.secrets import decode_secret_key
 
 
 class BaseEventHandler(Object, WithLogging):
     """Base class for all Event Handler classes in the Azure Storage Integrator."""
 
-    def get_app_status(self, model, charm_config) -> StatusBase:
+    context: Context
+    managers: Tuple[AzureStorageManager, ...]
+
+    def get_app_status(self) -> StatusBase:
         """Return the status of the charm."""
-        missing_options = []
-        for config_option in AZURE_MANDATORY_OPTIONS:
-            if not charm_config.get(config_option):
-                missing_options.append(config_option)
-        if missing_options:
-            self.logger.warning(f"Missing parameters: {missing_options}")
-            return BlockedStatus(f"Missing parameters: {missing_options}")
-        try:
-            decode_secret_key(model, charm_config.get("credentials"))
-        except Exception as e:
-            self.logger.warning(f"Error in decoding secret: {e}")
-            return BlockedStatus(str(e))
+        if error := self.context.azure_storage_error:
+            return BlockedStatus(error)
 
         return ActiveStatus()
 
+    def publish_connection_info(self) -> None:
+        """Publish the Azure Storage connection parameters to the relations of every manager."""
+        azure_storage = self.context.azure_storage
+        payload = azure_storage.to_dict() if azure_storage else None
+        for manager in self.managers:
+            manager.update_with_payload(payload)
+
 
 def compute_status(
     hook: Callable[[BaseEventHandler, EventBase], None],
@@ -45,13 +45,10 @@ def compute_status(
     def wrapper_hook(event_handler: BaseEventHandler, event: EventBase):
         """Return output after resetting statuses."""
         res = hook(event_handler, event)
+        status = event_handler.get_app_status()
         if event_handler.charm.unit.is_leader():
-            event_handler.charm.app.status = event_handler.get_app_status(
-                event_handler.charm.model, event_handler.charm.config
-            )
-        event_handler.charm.unit.status = event_handler.get_app_status(
-            event_handler.charm.model, event_handler.charm.config
-        )
+            event_handler.charm.app.status = status
+        event_handler.charm.unit.status = status
         return res
 
     return wrapper_hook
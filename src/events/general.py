@@ -34,6 +34,7 @@ class GeneralEvents(BaseEventHandler, WithLogging):
             self.charm.model, LEGACY_AZURE_RELATION_NAME
         )
         self.legacy_azure_storage_manager = AzureStorageManager(self.legacy_azure_provider_data)
+        self.managers = (self.azure_storage_manager, self.legacy_azure_storage_manager)
         self.framework.observe(
             self.charm.on[LEGACY_AZURE_RELATION_NAME].relation_joined, self._log_deprecation_notice
         )
@@ -69,11 +70,8 @@ class GeneralEvents(BaseEventHandler, WithLogging):
         if not self.charm.unit.is_leader():
             return
 
-        self.logger.debug(f"Config changed... Current configuration: {self.charm.config}")
-        self.azure_storage_manager.update(self.context.azure_storage)
-
-        # TODO (azure-interface): Remove this once all users have migrated to the new azure storage interface
-        self.legacy_azure_storage_manager.update(self.context.azure_storage)
+        self.logger.debug("Config changed... Current configuration: %s", self.charm.config)
+        self.publish_connection_info()
 
     @compute_status
     def _on_secret_changed(self, event: ops.SecretChangedEvent):
@@ -94,7 +92,7 @@ class GeneralEvents(BaseEventHandler, WithLogging):
         if self.charm.config.get("credentials") != secret.id:
             return
 
-        self.azure_storage_manager.update(self.context.azure_storage)
+        # The content of the secret has changed, so the cached connection info is stale
+        self.context.clear_cache()
 
-        # TODO (azure-interface): Remove this once all users have migrated to the new azure storage interface
-        self.legacy_azure_storage_manager.update(self.context.azure_storage)
+        self.publish_connection_info()
@@ -46,6 +46,7 @@ class AzureStorageProviderEvents(BaseEventHandler, WithLogging):
             self.charm, self.legacy_azure_provider_data
         )
         self.legacy_azure_storage_manager = AzureStorageManager(self.legacy_azure_provider_data)
+        self.managers = (self.azure_storage_manager, self.legacy_azure_storage_manager)
         self.framework.observe(
             self.legacy_azure_provider.on.storage_connection_info_requested,
             self._on_azure_storage_connection_info_requested,
@@ -64,7 +65,4 @@ class AzureStorageProviderEvents(BaseEventHandler, WithLogging):
         if not container_name:
             self.logger.warning("Container is setup by the requirer application!")
 
-        # TODO (azure-interface): Remove this once all users have migrated to the new azure storage interface
-        self.legacy_azure_storage_manager.update(self.context.azure_storage)
-
-        self.azure_storage_manager.update(self.context.azure_storage)
+        self.publish_connection_info()
@@ -4,6 +4,9 @@
 
 """Azure Storage manager."""
 
+from typing import Optional
+
+from constants import AZURE_RELATION_FIELDS
 from utils.logging import WithLogging
 
 
@@ -13,10 +16,27 @@ class AzureStorageManager(WithLogging):
     def __init__(self, relation_data):
         self.relation_data = relation_data
 
-    def update(self, azure_connection_info):
-        """Update the contents of the relation data bag."""
-        if len(self.relation_data.relations) > 0 and azure_connection_info:
+    def update_with_payload(self, payload: Optional[dict]):
+        """Update the contents of the relation data bag with a precomputed payload.
+
+        Only the fields whose value differs from the relation data bag are written, and
+        the fields published by this charm that are no longer part of the payload are removed.
+        """
+        if len(self.relation_data.relations) > 0 and payload:
             for relation in self.relation_data.relations:
-                self.relation_data.update_relation_data(
-                    relation.id, azure_connection_info.to_dict()
-                )
+                current = (
+                    self.relation_data.fetch_my_relation_data(
+                        [relation.id], list(AZURE_RELATION_FIELDS)
+                    )
+                    or {}
+                ).get(relation.id, {})
+                to_set = {k: v for k, v in payload.items() if current.get(k) != v}
+                to_delete = [k for k in current if k not in payload]
+
+                if not to_set and not to_delete:
+                    self.logger.debug("Relation %s is up to date, skipping update", relation.id)
+                    continue
+                if to_set:
+                    self.relation_data.update_relation_data(relation.id, to_set)
+                if to_delete:
+                    self.relation_data.delete_relation_data(relation.id, to_delete)
@@ -0,0 +1,33 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Utility functions related to the validation of the charm configuration."""
+
+from typing import List, Mapping
+
+from constants import AZURE_CONNECTION_PROTOCOLS, AZURE_MANDATORY_OPTIONS
+
+
+def validate_config(charm_config: Mapping) -> List[str]:
+    """Validate the charm configuration without accessing the credentials secret.
+
+    Args:
+        charm_config: the configuration of the charm
+
+    Returns:
+        List[str]: The validation errors, empty if the configuration is valid.
+    """
+    errors = []
+
+    missing_options = [opt for opt in AZURE_MANDATORY_OPTIONS if not charm_config.get(opt)]
+    if missing_options:
+        errors.append(f"Missing parameters: {missing_options}")
+
+    protocol = charm_config.get("connection-protocol")
+    if protocol and protocol.lower() not in AZURE_CONNECTION_PROTOCOLS:
+        errors.append(
+            f"Invalid connection-protocol '{protocol}', "
+            f"expected one of {list(AZURE_CONNECTION_PROTOCOLS)}"
+        )
+
+    return errors
@@ -3,9 +3,10 @@
 # Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import asyncio
 import json
 import logging
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 import yaml
 from juju.unit import Unit
@@ -13,6 +14,38 @@ from pytest_operator.plugin import OpsTest
 
 logger = logging.getLogger(__name__)
 
+# Use the libyaml-based loader when available, it is much faster than the pure Python one
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+async def await_until(
+    condition: Callable[[], bool],
+    timeout: float = 1000,
+    initial_interval: float = 0.05,
+    factor: float = 1.5,
+    max_interval: float = 2.0,
+) -> None:
+    """Wait until a condition is met, polling it with an exponential backoff.
+
+    Args:
+        condition: The callable to evaluate, returning True once the condition is met
+        timeout: The maximum number of seconds to wait for
+        initial_interval: The number of seconds to wait after the first evaluation
+        factor: The factor to increase the interval by after each evaluation
+        max_interval: The maximum number of seconds to wait between two evaluations
+
+    Raises:
+        asyncio.TimeoutError: When the condition is not met within the timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = initial_interval
+    while not condition():
+        if loop.time() >= deadline:
+            raise asyncio.TimeoutError(f"Condition not met within {timeout} seconds")
+        await asyncio.sleep(interval)
+        interval = min(interval * factor, max_interval)
+
 
 def is_relation_joined(ops_test: OpsTest, endpoint_one: str, endpoint_two: str) -> bool:
     """Check if a relation is joined.
@@ -64,6 +97,22 @@ async def run_command_on_unit(unit: Unit, command: str) -> Optional[str]:
     return stdout
 
 
+async def run_charm_action(unit: Unit, action_name: str, **params) -> Dict:
+    """Run an action on a Juju unit and return its results.
+
+    Args:
+        unit: the Juju unit instance.
+        action_name: the name of the action to run.
+        params: the parameters of the action.
+
+    Returns:
+        a dictionary that contains the results of the action.
+    """
+    action = await unit.run_action(action_name=action_name, **params)
+    action_result = await action.wait()
+    return action_result.results
+
+
 async def get_relation_data(
     ops_test: OpsTest,
     application_name: str,
@@ -88,7 +137,7 @@ async def get_relation_data(
     raw_data = (await ops_test.juju("show-unit", unit_name))[1]
     if not raw_data:
         raise ValueError(f"no unit info could be grabbed for {unit_name}")
-    data = yaml.safe_load(raw_data)
+    data = yaml.load(raw_data, Loader=YamlLoader)
     # Filter the data based on the relation name.
     relation_data = [v for v in data[unit_name]["relation-info"] if v["endpoint"] == relation_name]
     if len(relation_data) == 0:
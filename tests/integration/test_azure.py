@@ -11,22 +11,25 @@ import yaml
 from pytest_operator.plugin import OpsTest
 
 from .helpers import (
+    YamlLoader,
     add_juju_secret,
+    await_until,
     get_application_data,
     get_juju_secret,
     get_relation_data,
     is_relation_broken,
     is_relation_joined,
+    run_charm_action,
     update_juju_secret,
 )
 
 logger = logging.getLogger(__name__)
 
-CHARM_METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+CHARM_METADATA = yaml.load(Path("./metadata.yaml").read_text(), Loader=YamlLoader)
 CHARM_NAME = CHARM_METADATA["name"]
 
-TEST_APP_METADATA = yaml.safe_load(
-    Path("./tests/integration/test-charm-azure/metadata.yaml").read_text()
+TEST_APP_METADATA = yaml.load(
+    Path("./tests/integration/test-charm-azure/metadata.yaml").read_text(), Loader=YamlLoader
 )
 TEST_APP_NAME = TEST_APP_METADATA["name"]
 
@@ -34,6 +37,7 @@ TEST_APP_NAME = TEST_APP_METADATA["name"]
 APPS = [CHARM_NAME, TEST_APP_NAME]
 FIRST_RELATION = "first-azure-storage-credentials"
 SECOND_RELATION = "second-azure-storage-credentials"
+FAST_INTERVAL = "5s"
 
 
 @pytest.mark.group(1)
@@ -51,13 +55,14 @@ async def test_build_and_deploy(ops_test: OpsTest):
     )
 
     # Reduce the update_status frequency until the cluster is deployed
-    async with ops_test.fast_forward():
-        await ops_test.model.block_until(
-            lambda: len(ops_test.model.applications[CHARM_NAME].units) == 1
-        )
-
-        await ops_test.model.block_until(
-            lambda: len(ops_test.model.applications[TEST_APP_NAME].units) == 1
+    async with ops_test.fast_forward(FAST_INTERVAL):
+        await asyncio.gather(
+            ops_test.model.block_until(
+                lambda: len(ops_test.model.applications[CHARM_NAME].units) == 1
+            ),
+            ops_test.model.block_until(
+                lambda: len(ops_test.model.applications[TEST_APP_NAME].units) == 1
+            ),
         )
         await asyncio.gather(
             ops_test.model.wait_for_idle(
@@ -73,9 +78,10 @@ async def test_build_and_deploy(ops_test: OpsTest):
             ),
         )
 
-    assert len(ops_test.model.applications[CHARM_NAME].units) == 1
+    charm_app = ops_test.model.applications[CHARM_NAME]
+    assert len(charm_app.units) == 1
 
-    for unit in ops_test.model.applications[CHARM_NAME].units:
+    for unit in charm_app.units:
         assert unit.workload_status == "blocked"
 
     assert len(ops_test.model.applications[TEST_APP_NAME].units) == 1
@@ -120,8 +126,8 @@ async def test_relation_creation(ops_test: OpsTest):
     """Relate charms and wait for the expected changes in status."""
     await ops_test.model.integrate(CHARM_NAME, f"{TEST_APP_NAME}:{FIRST_RELATION}")
 
-    async with ops_test.fast_forward():
-        await ops_test.model.block_until(
+    async with ops_test.fast_forward(FAST_INTERVAL):
+        await await_until(
             lambda: is_relation_joined(ops_test, FIRST_RELATION, FIRST_RELATION) == True  # noqa: E712
         )
 
@@ -129,8 +135,10 @@ async def test_relation_creation(ops_test: OpsTest):
     await ops_test.model.wait_for_idle(apps=APPS, status="active")
     # test the content of the relation data bag
 
-    relation_data = await get_relation_data(ops_test, TEST_APP_NAME, FIRST_RELATION)
-    application_data = await get_application_data(ops_test, TEST_APP_NAME, FIRST_RELATION)
+    relation_data, application_data = await asyncio.gather(
+        get_relation_data(ops_test, TEST_APP_NAME, FIRST_RELATION),
+        get_application_data(ops_test, TEST_APP_NAME, FIRST_RELATION),
+    )
     logger.info(relation_data)
     logger.info(application_data)
 
@@ -157,8 +165,8 @@ async def test_relation_creation(ops_test: OpsTest):
     # check that container name set in the requirer application is correct
     await ops_test.model.add_relation(CHARM_NAME, f"{TEST_APP_NAME}:{SECOND_RELATION}")
     # wait for relation joined
-    async with ops_test.fast_forward():
-        await ops_test.model.block_until(
+    async with ops_test.fast_forward(FAST_INTERVAL):
+        await await_until(
             lambda: is_relation_joined(ops_test, SECOND_RELATION, SECOND_RELATION) == True  # noqa: E712
         )
         await ops_test.model.wait_for_idle(apps=APPS, status="active")
@@ -189,21 +197,21 @@ async def test_secret_updated(ops_test: OpsTest):
     )
     # wait for active status
     await ops_test.model.wait_for_idle(apps=[CHARM_NAME], status="active", timeout=1000)
-    # test the returns
+    # fetch the action results and the relation data bag concurrently
     azure_storage_integrator_unit = ops_test.model.applications[CHARM_NAME].units[0]
-    action = await azure_storage_integrator_unit.run_action(
-        action_name="get-azure-storage-connection-info"
+    configured_options, relation_data, application_data = await asyncio.gather(
+        run_charm_action(
+            azure_storage_integrator_unit, action_name="get-azure-storage-connection-info"
+        ),
+        get_relation_data(ops_test, TEST_APP_NAME, FIRST_RELATION),
+        get_application_data(ops_test, TEST_APP_NAME, FIRST_RELATION),
     )
-    action_result = await action.wait()
-    configured_options = action_result.results
     # test the correctness of the configuration fields
     assert configured_options["storage-account"] == "stoacc"
     assert configured_options["path"] == "/test/path_1/"
     assert configured_options["secret-key"] == "**********"
 
     # test the content of the relation data bag
-    relation_data = await get_relation_data(ops_test, TEST_APP_NAME, FIRST_RELATION)
-    application_data = await get_application_data(ops_test, TEST_APP_NAME, FIRST_RELATION)
     logger.info(relation_data)
     logger.info(application_data)
 
@@ -222,45 +230,43 @@ async def test_secret_updated(ops_test: OpsTest):
 @pytest.mark.abort_on_fail
 async def test_config_reset_container(ops_test: OpsTest):
     """Tests the correct handling of configuration parameters."""
+    charm_app = ops_test.model.applications[CHARM_NAME]
     configuration_parameters = {
         "container": "",
     }
     # apply new configuration options
-    await ops_test.model.applications[CHARM_NAME].set_config(configuration_parameters)
+    await charm_app.set_config(configuration_parameters)
 
     # wait for idle status
     await ops_test.model.wait_for_idle(apps=[CHARM_NAME], timeout=1000)
-    assert ops_test.model.applications[CHARM_NAME].units[0].workload_status == "blocked"
+    assert charm_app.units[0].workload_status == "blocked"
 
     configuration_parameters = {
         "container": "reconfigured-container",
     }
     # apply new configuration options
-    await ops_test.model.applications[CHARM_NAME].set_config(configuration_parameters)
+    await charm_app.set_config(configuration_parameters)
 
     # wait for idle status
     await ops_test.model.wait_for_idle(apps=[CHARM_NAME], timeout=1000, status="active")
-    assert ops_test.model.applications[CHARM_NAME].units[0].workload_status == "active"
+    assert charm_app.units[0].workload_status == "active"
 
 
 @pytest.mark.group(1)
 async def test_relation_broken(ops_test: OpsTest):
     """Remove relation and wait for the expected changes in status."""
-    # Remove relations
-    await ops_test.model.applications[CHARM_NAME].remove_relation(
-        f"{TEST_APP_NAME}:{FIRST_RELATION}", CHARM_NAME
-    )
-    await ops_test.model.block_until(
-        lambda: is_relation_broken(ops_test, FIRST_RELATION, FIRST_RELATION) is True
-    )
-    await ops_test.model.applications[CHARM_NAME].remove_relation(
-        f"{TEST_APP_NAME}:{SECOND_RELATION}", CHARM_NAME
-    )
-    await ops_test.model.block_until(
-        lambda: is_relation_broken(ops_test, SECOND_RELATION, SECOND_RELATION) is True
-    )
-    # test correct application status
-    async with ops_test.fast_forward():
+    charm_app = ops_test.model.applications[CHARM_NAME]
+    async with ops_test.fast_forward(FAST_INTERVAL):
+        # Remove relations
+        await charm_app.remove_relation(f"{TEST_APP_NAME}:{FIRST_RELATION}", CHARM_NAME)
+        await await_until(
+            lambda: is_relation_broken(ops_test, FIRST_RELATION, FIRST_RELATION) is True
+        )
+        await charm_app.remove_relation(f"{TEST_APP_NAME}:{SECOND_RELATION}", CHARM_NAME)
+        await await_until(
+            lambda: is_relation_broken(ops_test, SECOND_RELATION, SECOND_RELATION) is True
+        )
+        # test correct application status
         await asyncio.gather(
             ops_test.model.wait_for_idle(
                 apps=[CHARM_NAME], status="active", raise_on_blocked=True
@@ -3,9 +3,11 @@
 
 import unittest
 from asyncio.log import logger
+from unittest.mock import patch
 
-from ops.model import BlockedStatus
-from ops.testing import Harness
+from ops.model import ActiveStatus, BlockedStatus
+from ops.testing import ActionFailed, Harness
+from parameterized import parameterized
 
 from charm import AzureStorageIntegratorCharm
 from core.domain import AzureConnectionInfo
@@ -18,6 +20,22 @@ class TestCharm(unittest.TestCase):
         self.harness.begin()
         self.charm = self.harness.charm
 
+    def _configure(self, **overrides) -> str:
+        """Configure the charm with a granted credentials secret and return its id.
+
+        Keyword arguments override the default options, with underscores standing for dashes.
+        """
+        secret_id = self.harness.add_user_secret({"secret-key": "secret-key"})
+        self.harness.grant_secret(secret_id, self.harness.charm.app.name)
+        config = {
+            "storage-account": "storage-account",
+            "container": "container",
+            "credentials": secret_id,
+        }
+        config.update({key.replace("_", "-"): value for key, value in overrides.items()})
+        self.harness.update_config(config)
+        return secret_id
+
     def test_on_start(self):
         """Checks that the charm started in blocked status for missing parameters."""
         self.harness.set_leader(True)
@@ -34,7 +52,9 @@ class TestCharm(unittest.TestCase):
 
         self.harness.update_config({"storage-account": "storage-account"})
         self.harness.update_config({"container": "container"})
-        self.harness.update_config({"credentials": "secret:sdfasdfadfasdf"})
+        secret_id = self.harness.add_user_secret({"secret-key": "secret-key"})
+        self.harness.grant_secret(secret_id, self.harness.charm.app.name)
+        self.harness.update_config({"credentials": secret_id})
         self.harness.update_config({"path": "some/path"})
 
         self.assertEqual(self.harness.charm.config["storage-account"], "storage-account")
@@ -48,3 +68,135 @@ class TestCharm(unittest.TestCase):
         """Checks that context.azure_storage returns None when mandatory configs are not set."""
         self.harness.update_config({"storage-account": None})
         self.assertIsNone(self.harness.charm.context.azure_storage)
+
+    def test_azure_storage_info_cached(self):
+        """Checks that context.azure_storage is only recomputed when the config changes."""
+        self._configure()
+        azure_storage = self.harness.charm.context.azure_storage
+        self.assertIs(self.harness.charm.context.azure_storage, azure_storage)
+
+        self.harness.update_config({"container": "other-container"})
+        self.assertIsNot(self.harness.charm.context.azure_storage, azure_storage)
+        self.assertEqual(self.harness.charm.context.azure_storage.container, "other-container")
+
+    def test_secret_decoded_once_per_hook(self):
+        """Checks that the credentials secret is decoded only once within a hook."""
+        self.harness.set_leader(True)
+        self._configure()
+        self.harness.charm.context.clear_cache()
+        with patch("core.context.decode_secret_key", return_value="secret-key") as decode:
+            self.charm.on.update_status.emit()
+
+        decode.assert_called_once()
+        self.assertTrue(isinstance(self.harness.model.unit.status, ActiveStatus))
+
+    @parameterized.expand(
+        [
+            ("wasb", "wasb://container@account.blob.core.windows.net/"),
+            ("wasbs", "wasbs://container@account.blob.core.windows.net/"),
+            ("abfs", "abfs://container@account.dfs.core.windows.net/"),
+            ("abfss", "abfss://container@account.dfs.core.windows.net/"),
+            ("ABFSS", "abfss://container@account.dfs.core.windows.net/"),
+            ("unknown", ""),
+        ]
+    )
+    def test_endpoint(self, protocol, endpoint):
+        """Checks that the endpoint is derived from the connection protocol."""
+        info = AzureConnectionInfo(
+            connection_protocol=protocol,
+            container="container",
+            storage_account="account",
+            secret_key="secret-key",
+        )
+        self.assertEqual(info.endpoint, endpoint)
+        self.assertEqual(info.to_dict()["endpoint"], endpoint)
+        self.assertEqual(info.connection_protocol, protocol.lower())
+
+    def test_invalid_connection_protocol(self):
+        """Checks that the charm is blocked when the connection protocol is not supported."""
+        self.harness.set_leader(True)
+        self._configure(connection_protocol="ftp")
+
+        self.assertTrue(isinstance(self.harness.model.unit.status, BlockedStatus))
+        self.assertIn("connection-protocol", self.harness.model.unit.status.message)
+
+    def test_relation_data_not_rewritten_when_unchanged(self):
+        """Checks that the relation databag is only written when the payload changes."""
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("azure-storage-credentials", "requirer")
+        self._configure()
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertEqual(relation_data["container"], "container")
+        self.assertEqual(relation_data["secret-key"], "secret-key")
+
+        provider_data = self.harness.charm.general_events.azure_provider_data
+        with patch.object(provider_data, "update_relation_data") as update_relation_data:
+            self.charm.on.config_changed.emit()
+        update_relation_data.assert_not_called()
+
+    def test_credentials_switched_after_secret_rotation(self):
+        """Checks that switching credentials after a rotation publishes the new secret-key."""
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("azure-storage-credentials", "requirer")
+        first_secret_id = self._configure()
+
+        self.harness.set_secret_content(first_secret_id, {"secret-key": "rotated-secret-key"})
+        self.charm.on.secret_changed.emit(first_secret_id, None)
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertEqual(relation_data["secret-key"], "rotated-secret-key")
+
+        # the new secret holds the same value the first secret held before the rotation
+        second_secret_id = self.harness.add_user_secret({"secret-key": "secret-key"})
+        self.harness.grant_secret(second_secret_id, self.harness.charm.app.name)
+        self.harness.update_config({"credentials": second_secret_id})
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertEqual(relation_data["secret-key"], "secret-key")
+
+    def test_relation_data_kept_when_secret_not_decodable(self):
+        """Checks that a credentials secret that cannot be read does not wipe the relation."""
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("azure-storage-credentials", "requirer")
+        self._configure()
+
+        ungranted_secret_id = self.harness.add_user_secret({"secret-key": "other-secret-key"})
+        with patch("core.context.decode_secret_key", side_effect=Exception("denied")) as decode:
+            self.harness.update_config({"credentials": ungranted_secret_id})
+
+        decode.assert_called_once()
+        self.assertIsNone(self.harness.charm.context.azure_storage)
+        self.assertTrue(isinstance(self.harness.model.unit.status, BlockedStatus))
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertEqual(relation_data["secret-key"], "secret-key")
+
+    def test_relation_data_removes_unset_path(self):
+        """Checks that a path removed from the config is removed from the relation databag."""
+        self.harness.set_leader(True)
+        relation_id = self.harness.add_relation("azure-storage-credentials", "requirer")
+        self._configure(path="some/path")
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertEqual(relation_data["path"], "some/path")
+
+        self.harness.update_config({"path": ""})
+        relation_data = self.harness.get_relation_data(relation_id, self.harness.charm.app.name)
+        self.assertNotIn("path", relation_data)
+        self.assertEqual(relation_data["container"], "container")
+
+    def test_context_shared_by_event_handlers(self):
+        """Checks that all event handlers share the charm context and its caches."""
+        self.assertIs(self.charm.general_events.context, self.charm.context)
+        self.assertIs(self.charm.azure_storage_provider_events.context, self.charm.context)
+        self.assertIs(self.charm.action_events.context, self.charm.context)
+
+    def test_get_connection_info_action_not_configured(self):
+        """Checks that the connection info action fails when the charm is not configured."""
+        with self.assertRaises(ActionFailed):
+            self.harness.run_action("get-azure-storage-connection-info")
+
+    def test_get_connection_info_action(self):
+        """Checks that the connection info action returns the parameters with a masked secret."""
+        self._configure()
+
+        output = self.harness.run_action("get-azure-storage-connection-info")
+        self.assertEqual(output.results["container"], "container")
+        self.assertEqual(output.results["secret-key"], "**********")
+        self.assertNotIn("path", output.results)